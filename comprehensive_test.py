@@ -11,13 +11,125 @@ This advanced test suite demonstrates every feature of QuantFlow Finance:
 Perfect for showcasing the package's capabilities!
 """
 
+import math
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from scipy.stats import norm
 from datetime import datetime, timedelta
 import warnings
+from numpy.lib.stride_tricks import sliding_window_view
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
+# Annualization constants for daily data, computed once rather than in loops
+TRADING_DAYS = 252
+SQRT252 = math.sqrt(TRADING_DAYS)
+RISK_FREE_RATE = 0.03  # Annual risk-free rate for performance metrics
+RF_DAILY = RISK_FREE_RATE / TRADING_DAYS
+MC_STREAMS = 16  # Independent random streams for the Monte Carlo paths
+MC_MAX_ROWS = 4096  # Paths drawn per batch, bounding Monte Carlo memory
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional (pip install quantflow-finance[numba]); without it the
+    # jitted helpers below are plain Python and the script switches to the
+    # NumPy implementations instead
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_sharpe_vol(returns, window, rf_daily):
+    """
+    Rolling annualized Sharpe ratio and volatility over trailing windows.
+    
+    Window k covers returns[k:k + window]. Running sums of the returns and of
+    their squares are updated as the window slides, so each step is O(1)
+    instead of re-reducing the whole window.
+    """
+    # Outputs are preallocated; with too little history they are just empty
+    n_out = max(len(returns) - window, 0)
+    sharpe = np.empty(n_out)
+    vol = np.empty(n_out)
+    if n_out == 0:
+        return sharpe, vol
+    
+    s = 0.0
+    s2 = 0.0
+    for i in range(window):
+        s += returns[i]
+        s2 += returns[i] * returns[i]
+    
+    for k in range(n_out):
+        if k > 0:
+            old = returns[k - 1]
+            new = returns[k + window - 1]
+            s += new - old
+            s2 += new * new - old * old
+        
+        mean = s / window
+        # Sample variance (ddof=1); cancellation in the running sums can push a
+        # flat window slightly below zero, so clamp before the square root
+        std = np.sqrt(max((s2 - s * mean) / (window - 1), 0.0))
+        sharpe[k] = (mean - rf_daily) / std * SQRT252
+        vol[k] = std * SQRT252
+    
+    return sharpe, vol
+
+
+def rolling_sharpe_vol_numpy(returns, window, rf_daily):
+    """
+    Pure NumPy version of rolling_sharpe_vol for when Numba is not installed.
+    
+    The trailing windows are a strided (n_windows, window) view of the
+    returns, so no data is copied. Each statistic is then one reduction
+    along axis 1, run in C.
+    """
+    if len(returns) <= window:
+        return np.empty(0), np.empty(0)
+    
+    # Drop the last observation so window k covers returns[k:k + window]
+    windows = sliding_window_view(returns[:-1], window)
+    means = windows.mean(axis=1)
+    stds = windows.std(axis=1, ddof=1)
+    return (means - rf_daily) / stds * SQRT252, stds * SQRT252
+
+
+def simulate_final_values(streams, num_simulations, time_horizon, mean_return, volatility, initial_value):
+    """
+    Compound normally distributed daily returns along independent paths.
+    
+    The paths are split into one contiguous block per random stream and the
+    blocks run in a thread pool; NumPy releases the GIL while drawing and
+    reducing, so wall time scales with the number of cores. Each block is
+    drawn in batches of at most MC_MAX_ROWS paths, and the result depends only
+    on the streams, not on how many threads ran them.
+    """
+    final_values = np.empty(num_simulations)
+    block = -(-num_simulations // len(streams))
+    
+    def run_block(i):
+        end = min((i + 1) * block, num_simulations)
+        for start in range(i * block, end, MC_MAX_ROWS):
+            stop = min(start + MC_MAX_ROWS, end)
+            # float32 returns halve memory traffic; the log-sum is accumulated in float64
+            daily_returns = streams[i].standard_normal((stop - start, time_horizon), dtype=np.float32)
+            daily_returns *= np.float32(volatility)
+            daily_returns += np.float32(mean_return)
+            final_values[start:stop] = initial_value * np.exp(np.log1p(daily_returns).sum(axis=1, dtype=np.float64))
+    
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(run_block, range(len(streams))))
+    return final_values
+
+
 print("🚀 COMPREHENSIVE QUANTFLOW FINANCE TEST SUITE")
 print("=" * 80)
 print(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -25,7 +137,7 @@ print("=" * 80)
 
 try:
     # Import QuantFlow Finance
-    from quantflow import BlackScholes, RiskMetrics, MarketData
+    from quantflow import BlackScholes, RiskMetrics, MarketData, greeks_batch
     print("✅ QuantFlow Finance successfully imported!")
     
     # ==========================================
@@ -53,56 +165,44 @@ try:
     print(f"{'Strike':<8} {'Expiry':<8} {'Type':<6} {'Price':<8} {'Delta':<8} {'Gamma':<8} {'Theta':<10} {'Vega':<8} {'Rho':<8}")
     print("-" * 80)
     
-    options_data = []
-    
-    for strike in strikes:
-        for expiry in expiries:
-            # Call option
-            call = BlackScholes(S=spot_price, K=strike, T=expiry, r=risk_free_rate, sigma=volatility, option_type='call')
-            call_greeks = call.greeks()
-            
-            # Put option
-            put = BlackScholes(S=spot_price, K=strike, T=expiry, r=risk_free_rate, sigma=volatility, option_type='put')
-            put_greeks = put.greeks()
-            
-            # Store data
-            options_data.append({
-                'Strike': strike, 'Expiry': expiry, 'Type': 'Call',
-                'Price': call_greeks['price'], 'Delta': call_greeks['delta'],
-                'Gamma': call_greeks['gamma'], 'Theta': call_greeks['theta'],
-                'Vega': call_greeks['vega'], 'Rho': call_greeks['rho']
-            })
-            
-            options_data.append({
-                'Strike': strike, 'Expiry': expiry, 'Type': 'Put',
-                'Price': put_greeks['price'], 'Delta': put_greeks['delta'],
-                'Gamma': put_greeks['gamma'], 'Theta': put_greeks['theta'],
-                'Vega': put_greeks['vega'], 'Rho': put_greeks['rho']
-            })
-            
-            # Print call
-            print(f"{strike:<8} {expiry:<8.2f} {'Call':<6} {call_greeks['price']:<8.2f} {call_greeks['delta']:<8.3f} {call_greeks['gamma']:<8.4f} {call_greeks['theta']:<10.2f} {call_greeks['vega']:<8.3f} {call_greeks['rho']:<8.3f}")
-            
-            # Print put
-            print(f"{strike:<8} {expiry:<8.2f} {'Put':<6} {put_greeks['price']:<8.2f} {put_greeks['delta']:<8.3f} {put_greeks['gamma']:<8.4f} {put_greeks['theta']:<10.2f} {put_greeks['vega']:<8.3f} {put_greeks['rho']:<8.3f}")
+    # Price the whole (strike, expiry) grid in one batch: a trailing axis
+    # holds the call and the put for each cell, shape (strikes, expiries, 2)
+    K_grid, T_grid = np.meshgrid(np.array(strikes, dtype=float), np.array(expiries, dtype=float), indexing='ij')
+    grid_greeks = greeks_batch(S=spot_price, K=K_grid[..., None], T=T_grid[..., None], r=risk_free_rate,
+                               sigma=volatility, option_types=['call', 'put'])
+    call_px = grid_greeks['price'][..., 0]
+    put_px = grid_greeks['price'][..., 1]
+    
+    # One array per column, rows ordered (strike, expiry) with the call
+    # followed by the put
+    options_data = pd.DataFrame({
+        'Strike': K_grid.ravel().repeat(2),
+        'Expiry': T_grid.ravel().repeat(2),
+        'Type': np.tile(['Call', 'Put'], K_grid.size),
+        **{name.capitalize(): grid_greeks[name].ravel()
+           for name in ['price', 'delta', 'gamma', 'theta', 'vega', 'rho']}
+    })
+    
+    for i, strike in enumerate(strikes):
+        for j, expiry in enumerate(expiries):
+            for t, option_type in enumerate(['Call', 'Put']):
+                g = {name: values[i, j, t] for name, values in grid_greeks.items()}
+                print(f"{strike:<8} {expiry:<8.2f} {option_type:<6} {g['price']:<8.2f} {g['delta']:<8.3f} {g['gamma']:<8.4f} {g['theta']:<10.2f} {g['vega']:<8.3f} {g['rho']:<8.3f}")
     
     # Put-Call Parity Verification
     print("\n" + "-" * 60)
     print("🔍 PUT-CALL PARITY VERIFICATION")
     print("-" * 60)
     
-    for strike in strikes:
-        for expiry in expiries:
-            call = BlackScholes(S=spot_price, K=strike, T=expiry, r=risk_free_rate, sigma=volatility, option_type='call')
-            put = BlackScholes(S=spot_price, K=strike, T=expiry, r=risk_free_rate, sigma=volatility, option_type='put')
-            
-            # Put-Call Parity: C - P = S - K*e^(-rT)
-            left_side = call.price() - put.price()
-            right_side = spot_price - strike * np.exp(-risk_free_rate * expiry)
-            error = abs(left_side - right_side)
-            
-            status = "✅ PASS" if error < 0.001 else "❌ FAIL"
-            print(f"K={strike}, T={expiry:.2f}: Error = {error:.6f} {status}")
+    # Put-Call Parity: C - P = S - K*e^(-rT), checked on the grid priced above.
+    # Calls and puts come from separate N(d) and N(-d) evaluations.
+    parity_error = np.abs((call_px - put_px) - (spot_price - K_grid * np.exp(-risk_free_rate * T_grid)))
+    parity_passed = parity_error < 0.001
+    
+    for i, strike in enumerate(strikes):
+        for j, expiry in enumerate(expiries):
+            status = "✅ PASS" if parity_passed[i, j] else "❌ FAIL"
+            print(f"K={strike}, T={expiry:.2f}: Error = {parity_error[i, j]:.6f} {status}")
     
     # ==========================================
     # SECTION 2: REAL MARKET DATA ANALYSIS
@@ -120,7 +220,8 @@ try:
     print("\nFetching real market data...")
     
     # Fetch market data
-    market_data = MarketData.fetch_stock_data(tickers, period='1y')
+    # Cached on disk for a day so repeated runs skip the network round-trip
+    market_data = MarketData.fetch_stock_data(tickers, period='1y', cache_dir='.qf_cache')
     returns_data = MarketData.calculate_returns(market_data)
     
     print(f"✅ Successfully fetched {len(market_data)} days of market data")
@@ -133,16 +234,19 @@ try:
     print(f"{'Ticker':<8} {'Latest Price':<12} {'Ann. Return':<12} {'Ann. Vol':<12} {'Sharpe':<8}")
     print("-" * 60)
     
+    # Select columns by ticker so they line up with the weights (yfinance may
+    # return them in a different order) and work on the raw array from here on
+    R = returns_data[tickers].to_numpy()
+    
+    # Calculate annualized metrics for every ticker at once
+    annual_returns = R.mean(axis=0) * TRADING_DAYS
+    annual_vols = R.std(axis=0, ddof=1) * SQRT252
+    sharpe_ratios = (annual_returns - RISK_FREE_RATE) / annual_vols
+    latest_prices = market_data[tickers].iloc[-1].to_numpy()
+    
     individual_stats = {}
-    for ticker in tickers:
-        latest_price = market_data[ticker].iloc[-1]
-        stock_returns = returns_data[ticker]
-        
-        # Calculate annualized metrics
-        annual_return = stock_returns.mean() * 252
-        annual_vol = stock_returns.std() * np.sqrt(252)
-        sharpe_ratio = (annual_return - 0.03) / annual_vol  # Assuming 3% risk-free rate
-        
+    for ticker, latest_price, annual_return, annual_vol, sharpe_ratio in zip(
+            tickers, latest_prices, annual_returns, annual_vols, sharpe_ratios):
         individual_stats[ticker] = {
             'price': latest_price,
             'annual_return': annual_return,
@@ -159,8 +263,10 @@ try:
     print("⚠️  SECTION 3: COMPREHENSIVE PORTFOLIO RISK ANALYSIS")
     print("=" * 80)
     
-    # Calculate portfolio returns
-    portfolio_returns = (returns_data * portfolio_weights).sum(axis=1)
+    # Calculate portfolio returns with one matrix-vector product
+    weights = np.asarray(portfolio_weights)
+    p = R @ weights
+    portfolio_returns = pd.Series(p, index=returns_data.index)
     
     # Comprehensive risk analysis
     risk_analyzer = RiskMetrics(portfolio_returns)
@@ -175,36 +281,28 @@ try:
         print(f"{(1-level)*100:>4.0f}% VaR: {var_value:>8.2%} | ES: {es_value:>8.2%}")
     
     # Performance metrics
-    sharpe = risk_analyzer.sharpe_ratio(risk_free_rate=0.03)
+    sharpe = risk_analyzer.sharpe_ratio(risk_free_rate=RISK_FREE_RATE)
     max_dd = risk_analyzer.max_drawdown()
     
     print(f"\n📊 PERFORMANCE METRICS")
     print("-" * 40)
     print(f"Sharpe Ratio:      {sharpe:>8.3f}")
     print(f"Max Drawdown:      {max_dd:>8.2%}")
-    print(f"Annual Return:     {portfolio_returns.mean() * 252:>8.2%}")
-    print(f"Annual Volatility: {portfolio_returns.std() * np.sqrt(252):>8.2%}")
+    print(f"Annual Return:     {p.mean() * TRADING_DAYS:>8.2%}")
+    print(f"Annual Volatility: {p.std(ddof=1) * SQRT252:>8.2%}")
     
     # Rolling metrics analysis
     print(f"\n📈 ROLLING RISK METRICS (30-day windows)")
     print("-" * 50)
     
     rolling_window = 30
-    rolling_sharpe = []
-    rolling_vol = []
+    rolling = rolling_sharpe_vol if NUMBA_AVAILABLE else rolling_sharpe_vol_numpy
+    rolling_sharpe, rolling_vol = rolling(p, rolling_window, RF_DAILY)
     
-    for i in range(rolling_window, len(portfolio_returns)):
-        window_returns = portfolio_returns.iloc[i-rolling_window:i]
-        window_sharpe = (window_returns.mean() - 0.03/252) / window_returns.std() * np.sqrt(252)
-        window_vol = window_returns.std() * np.sqrt(252)
-        
-        rolling_sharpe.append(window_sharpe)
-        rolling_vol.append(window_vol)
-    
-    print(f"Average Rolling Sharpe: {np.mean(rolling_sharpe):>8.3f}")
-    print(f"Rolling Sharpe Std:     {np.std(rolling_sharpe):>8.3f}")
-    print(f"Average Rolling Vol:    {np.mean(rolling_vol):>8.2%}")
-    print(f"Rolling Vol Std:        {np.std(rolling_vol):>8.2%}")
+    print(f"Average Rolling Sharpe: {rolling_sharpe.mean():>8.3f}")
+    print(f"Rolling Sharpe Std:     {rolling_sharpe.std():>8.3f}")
+    print(f"Average Rolling Vol:    {rolling_vol.mean():>8.2%}")
+    print(f"Rolling Vol Std:        {rolling_vol.std():>8.2%}")
     
     # ==========================================
     # SECTION 4: CORRELATION & DIVERSIFICATION
@@ -214,14 +312,16 @@ try:
     print("=" * 80)
     
     # Correlation matrix
-    correlation_matrix = returns_data.corr()
+    # Returns are dense after calculate_returns, so skip pandas' NaN-aware
+    # pairwise path and correlate the ticker-aligned array in one pass
+    correlation_matrix = pd.DataFrame(np.corrcoef(R, rowvar=False), index=tickers, columns=tickers)
     print("📊 CORRELATION MATRIX")
     print("-" * 60)
     print(correlation_matrix.round(3))
     
     # Diversification metrics
-    portfolio_var = np.var(portfolio_returns)
-    weighted_individual_var = sum(w**2 * np.var(returns_data[ticker]) for w, ticker in zip(portfolio_weights, tickers))
+    portfolio_var = p.var()
+    weighted_individual_var = np.einsum('j,j->', weights * weights, R.var(axis=0))
     diversification_ratio = 1 - (portfolio_var / weighted_individual_var)
     
     print(f"\n🎯 DIVERSIFICATION METRICS")
@@ -239,7 +339,7 @@ try:
     
     # Using AAPL current price for options strategies
     aapl_price = market_data['AAPL'].iloc[-1]
-    aapl_vol = returns_data['AAPL'].std() * np.sqrt(252)
+    aapl_vol = individual_stats['AAPL']['annual_vol']
     
     print(f"📈 AAPL Current Price: ${aapl_price:.2f}")
     print(f"📊 AAPL Implied Vol: {aapl_vol:.1%}")
@@ -251,16 +351,17 @@ try:
     upper_strike = aapl_price * 1.04
     expiry = 0.25  # 3 months
     
-    long_call = BlackScholes(S=aapl_price, K=lower_strike, T=expiry, r=0.05, sigma=aapl_vol, option_type='call')
-    short_call = BlackScholes(S=aapl_price, K=upper_strike, T=expiry, r=0.05, sigma=aapl_vol, option_type='call')
+    # Both legs priced in one batch: [long lower call, short upper call]
+    spread = greeks_batch(S=aapl_price, K=[lower_strike, upper_strike], T=expiry, r=0.05, sigma=aapl_vol,
+                          option_types=['call', 'call'])
     
-    spread_cost = long_call.price() - short_call.price()
-    spread_delta = long_call.delta() - short_call.delta()
-    spread_gamma = long_call.gamma() - short_call.gamma()
-    spread_theta = long_call.theta() - short_call.theta()
+    spread_cost = spread['price'][0] - spread['price'][1]
+    spread_delta = spread['delta'][0] - spread['delta'][1]
+    spread_gamma = spread['gamma'][0] - spread['gamma'][1]
+    spread_theta = spread['theta'][0] - spread['theta'][1]
     
-    print(f"Long {lower_strike:.0f} Call:  ${long_call.price():.2f}")
-    print(f"Short {upper_strike:.0f} Call: ${short_call.price():.2f}")
+    print(f"Long {lower_strike:.0f} Call:  ${spread['price'][0]:.2f}")
+    print(f"Short {upper_strike:.0f} Call: ${spread['price'][1]:.2f}")
     print(f"Net Premium:        ${spread_cost:.2f}")
     print(f"Net Delta:          {spread_delta:.3f}")
     print(f"Net Gamma:          {spread_gamma:.4f}")
@@ -276,14 +377,13 @@ try:
     call_strike_low = aapl_price * 1.04
     call_strike_high = aapl_price * 1.08
     
-    # Iron Condor legs
-    long_put_low = BlackScholes(S=aapl_price, K=put_strike_low, T=expiry, r=0.05, sigma=aapl_vol, option_type='put')
-    short_put_high = BlackScholes(S=aapl_price, K=put_strike_high, T=expiry, r=0.05, sigma=aapl_vol, option_type='put')
-    short_call_low = BlackScholes(S=aapl_price, K=call_strike_low, T=expiry, r=0.05, sigma=aapl_vol, option_type='call')
-    long_call_high = BlackScholes(S=aapl_price, K=call_strike_high, T=expiry, r=0.05, sigma=aapl_vol, option_type='call')
+    # Iron Condor legs: long low put, short high put, short low call, long high call
+    condor = greeks_batch(S=aapl_price, K=[put_strike_low, put_strike_high, call_strike_low, call_strike_high],
+                          T=expiry, r=0.05, sigma=aapl_vol, option_types=['put', 'put', 'call', 'call'])
+    short_legs = np.array([-1, 1, 1, -1])  # +1 for legs sold, -1 for legs bought
     
-    condor_premium = (short_put_high.price() + short_call_low.price()) - (long_put_low.price() + long_call_high.price())
-    condor_delta = (short_put_high.delta() + short_call_low.delta()) - (long_put_low.delta() + long_call_high.delta())
+    condor_premium = short_legs @ condor['price']
+    condor_delta = short_legs @ condor['delta']
     
     print(f"Net Premium Received: ${condor_premium:.2f}")
     print(f"Net Delta:           {condor_delta:.4f}")
@@ -308,42 +408,64 @@ try:
     print(f"💰 Initial Value: ${initial_portfolio_value:,}")
     
     # Historical parameters
-    mean_return = portfolio_returns.mean()
-    volatility = portfolio_returns.std()
-    
-    print(f"📊 Historical Daily Return: {mean_return:.4f} ({mean_return*252:.2%} annual)")
-    print(f"📈 Historical Daily Vol: {volatility:.4f} ({volatility*np.sqrt(252):.2%} annual)")
-    
-    # Monte Carlo simulation
-    np.random.seed(42)  # For reproducibility
-    final_values = []
+    mean_return = p.mean()
+    volatility = p.std(ddof=1)
+    
+    print(f"📊 Historical Daily Return: {mean_return:.4f} ({mean_return*TRADING_DAYS:.2%} annual)")
+    print(f"📈 Historical Daily Vol: {volatility:.4f} ({volatility*SQRT252:.2%} annual)")
+    
+    # Monte Carlo simulation: one PCG64 stream per block of paths, spawned from
+    # a fixed seed for reproducibility
+    streams = [np.random.Generator(np.random.PCG64(seed)) for seed in np.random.SeedSequence(42).spawn(MC_STREAMS)]
+    final_values = simulate_final_values(streams, num_simulations, time_horizon, mean_return, volatility,
+                                         initial_portfolio_value)
+    
+    # Monte Carlo results: sort once and read every order statistic from it.
+    # np.interp on the sorted values is np.percentile's linear interpolation.
+    fv_sorted = np.sort(final_values)
+    n_final = len(fv_sorted)
+    q5, q50, q95 = np.interp(np.array([0.05, 0.50, 0.95]) * (n_final - 1), np.arange(n_final), fv_sorted)
+    prob_loss = np.searchsorted(fv_sorted, initial_portfolio_value, side='left') / n_final
+    mean_final = fv_sorted.mean()
     
-    for sim in range(num_simulations):
-        daily_returns = np.random.normal(mean_return, volatility, time_horizon)
-        portfolio_value = initial_portfolio_value
-        
-        for daily_return in daily_returns:
-            portfolio_value *= (1 + daily_return)
-        
-        final_values.append(portfolio_value)
-    
-    final_values = np.array(final_values)
-    
-    # Monte Carlo results
     print(f"\n📊 MONTE CARLO RESULTS")
     print("-" * 40)
-    print(f"Mean Final Value:    ${np.mean(final_values):>12,.0f}")
-    print(f"Median Final Value:  ${np.median(final_values):>12,.0f}")
-    print(f"5th Percentile:      ${np.percentile(final_values, 5):>12,.0f}")
-    print(f"95th Percentile:     ${np.percentile(final_values, 95):>12,.0f}")
-    print(f"Probability of Loss: {np.mean(final_values < initial_portfolio_value):>12.1%}")
-    print(f"Maximum Gain:        ${np.max(final_values):>12,.0f}")
-    print(f"Maximum Loss:        ${np.min(final_values):>12,.0f}")
+    print(f"Mean Final Value:    ${mean_final:>12,.0f}")
+    print(f"Median Final Value:  ${q50:>12,.0f}")
+    print(f"5th Percentile:      ${q5:>12,.0f}")
+    print(f"95th Percentile:     ${q95:>12,.0f}")
+    print(f"Probability of Loss: {prob_loss:>12.1%}")
+    print(f"Maximum Gain:        ${fv_sorted[-1]:>12,.0f}")
+    print(f"Maximum Loss:        ${fv_sorted[0]:>12,.0f}")
     
     # Expected returns
-    expected_return = (np.mean(final_values) / initial_portfolio_value) - 1
+    expected_return = (mean_final / initial_portfolio_value) - 1
     print(f"Expected Annual Return: {expected_return:>10.2%}")
     
+    # Closed-form counterparts of the summary statistics. With iid daily
+    # returns the mean is exact: E[V_T] = V0 * (1 + mu)^T. log(V_T / V0) is a
+    # sum of T iid log(1 + r) terms, so it is close to normal, with moments
+    # taken from a second-order expansion of log(1 + r).
+    log_mean = np.log1p(mean_return) - volatility**2 / (2 * (1 + mean_return)**2)
+    log_std = volatility / (1 + mean_return)
+    horizon_mean = time_horizon * log_mean
+    horizon_std = np.sqrt(time_horizon) * log_std
+    
+    analytic_mean = initial_portfolio_value * (1 + mean_return)**time_horizon
+    analytic_q5, analytic_q50, analytic_q95 = initial_portfolio_value * np.exp(
+        horizon_mean + horizon_std * norm.ppf([0.05, 0.50, 0.95]))
+    analytic_prob_loss = norm.cdf(-horizon_mean / horizon_std)
+    mc_standard_error = fv_sorted.std(ddof=1) / np.sqrt(n_final)
+    
+    print(f"\n📐 ANALYTIC (LOG-NORMAL) RESULTS")
+    print("-" * 40)
+    print(f"Mean Final Value:    ${analytic_mean:>12,.0f}")
+    print(f"Median Final Value:  ${analytic_q50:>12,.0f}")
+    print(f"5th Percentile:      ${analytic_q5:>12,.0f}")
+    print(f"95th Percentile:     ${analytic_q95:>12,.0f}")
+    print(f"Probability of Loss: {analytic_prob_loss:>12.1%}")
+    print(f"MC Mean Error:       {(mean_final - analytic_mean) / mc_standard_error:>12.2f} std errors")
+    
     # ==========================================
     # SECTION 7: SUMMARY & RECOMMENDATIONS
     # ==========================================
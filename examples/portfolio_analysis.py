@@ -33,8 +33,8 @@ def main():
     print(f"Portfolio: {tickers}")
     print(f"Weights: {portfolio_weights}")
     
-    # Fetch 1 year of data
-    prices = MarketData.fetch_stock_data(tickers, period='1y')
+    # Fetch 1 year of data (cached on disk for a day)
+    prices = MarketData.fetch_stock_data(tickers, period='1y', cache_dir='.qf_cache')
     returns = MarketData.calculate_returns(prices)
     
     print(f"Data period: {prices.index[0].date()} to {prices.index[-1].date()}")
@@ -42,7 +42,7 @@ def main():
     
     # Step 2: Calculate portfolio returns
     print("\n📊 Step 2: Portfolio Construction")
-    portfolio_returns = (returns * portfolio_weights).sum(axis=1)
+    portfolio_returns = pd.Series(returns[tickers].to_numpy() @ np.asarray(portfolio_weights), index=returns.index)
     
     print(f"Portfolio daily return: {portfolio_returns.mean():.4f} ({portfolio_returns.mean()*100:.2f}%)")
     print(f"Portfolio daily volatility: {portfolio_returns.std():.4f} ({portfolio_returns.std()*100:.2f}%)")
@@ -126,6 +126,12 @@ MIT License - Free for academic and commercial use.
             "black",
             "flake8",
         ],
+        "numba": [
+            "numba>=0.56",
+        ],
+        "cache": [
+            "pyarrow>=7.0",
+        ],
     },
     keywords="quantitative finance, options pricing, risk management, black-scholes, portfolio analysis, financial engineering, derivatives, VaR, market data",
     project_urls={
@@ -9,8 +9,8 @@ __author__ = "JEEVAN B A"
 __email__ = "jeevanba273@gmail.com"
 
 # Import main classes for easy access
-from .options.black_scholes import BlackScholes
+from .options.black_scholes import BlackScholes, greeks_batch
 from .risk.metrics import RiskMetrics
 from .data.fetcher import MarketData
 
-__all__ = ['BlackScholes', 'RiskMetrics', 'MarketData']
\ No newline at end of file
+__all__ = ['BlackScholes', 'greeks_batch', 'RiskMetrics', 'MarketData']
\ No newline at end of file
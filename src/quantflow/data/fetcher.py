@@ -9,7 +9,8 @@ import pandas as pd
 import numpy as np
 import time
 import random
-from typing import Union, List
+from pathlib import Path
+from typing import Optional, Union, List
 
 
 class MarketData:
@@ -19,7 +20,8 @@ class MarketData:
     
     @staticmethod
     def fetch_stock_data(tickers: Union[str, List[str]], period='1y', interval='1d', 
-                        max_tries=3, delay_range=(1, 3)):
+                        max_tries=3, delay_range=(1, 3), cache_dir: Optional[str] = None,
+                        cache_max_age=86400):
         """
         Fetch stock data from Yahoo Finance with retry logic.
         
@@ -29,6 +31,9 @@ class MarketData:
         interval: str - Data interval ('1d', '1wk', '1mo')
         max_tries: int - Maximum number of retry attempts
         delay_range: tuple - Random delay range between retries (min, max seconds)
+        cache_dir: str or None - Directory for a parquet cache of the result
+            (requires pyarrow); None disables caching
+        cache_max_age: float - Seconds a cached result stays valid (default 1 day)
         
         Returns:
         pandas DataFrame with adjusted close prices
@@ -39,6 +44,13 @@ class MarketData:
         if isinstance(tickers, str):
             tickers = [tickers]
         
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir) / f"{'_'.join(sorted(tickers))}_{period}_{interval}.parquet"
+            cached = MarketData._read_cache(cache_path, cache_max_age)
+            if cached is not None:
+                return cached
+        
         last_exception = None
         
         for attempt in range(max_tries):
@@ -93,6 +105,8 @@ class MarketData:
                     raise ValueError(f"All data is empty or NaN for tickers: {tickers}")
                 
                 print(f"Successfully fetched {len(result)} rows of data")
+                if cache_path is not None:
+                    MarketData._write_cache(result, cache_path)
                 return result
                 
             except Exception as e:
@@ -109,6 +123,42 @@ class MarketData:
         # If all attempts failed
         raise Exception(f"Failed to fetch data after {max_tries} attempts. Last error: {last_exception}")
     
+    @staticmethod
+    def _read_cache(cache_path: Path, max_age):
+        """
+        Load a cached result if it exists and is younger than max_age seconds.
+        
+        Returns:
+        pandas DataFrame, or None if there is no usable cache entry
+        """
+        if not cache_path.exists() or time.time() - cache_path.stat().st_mtime >= max_age:
+            return None
+        
+        try:
+            data = pd.read_parquet(cache_path)
+        except ImportError:
+            print("Warning: pyarrow is required to read the data cache (pip install quantflow-finance[cache])")
+            return None
+        except Exception as e:
+            print(f"Warning: Could not read data cache {cache_path}: {str(e)}")
+            return None
+        
+        print(f"Loaded {len(data)} rows of cached data from {cache_path}")
+        return data
+    
+    @staticmethod
+    def _write_cache(data, cache_path: Path):
+        """Store a fetched result in the parquet cache; failures only warn."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(cache_path, compression='zstd')
+        except ImportError:
+            print("Warning: pyarrow is required to cache market data (pip install quantflow-finance[cache])")
+        except Exception as e:
+            # Never let a cache problem (e.g. pyarrow's ArrowInvalid) reach the
+            # retry handler and turn a successful download into a failed fetch
+            print(f"Warning: Could not write data cache {cache_path}: {str(e)}")
+    
     @staticmethod
     def fetch_single_stock_batch(tickers: List[str], period='1y', interval='1d', 
                                 batch_delay=2):
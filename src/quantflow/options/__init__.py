@@ -5,6 +5,6 @@ This module provides implementations of various option pricing models including
 the Black-Scholes-Merton model for European options.
 """
 
-from .black_scholes import BlackScholes
+from .black_scholes import BlackScholes, greeks_batch
 
-__all__ = ['BlackScholes']
\ No newline at end of file
+__all__ = ['BlackScholes', 'greeks_batch']
\ No newline at end of file
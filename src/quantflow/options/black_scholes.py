@@ -7,11 +7,19 @@ for European option pricing, including all Greeks calculations (Delta, Gamma, Th
 """
 
 import numpy as np
-from scipy.stats import norm
-from typing import Dict, Union, Literal
+from scipy.special import ndtr
+from typing import Dict, Union, Literal, Sequence
 import warnings
 
 
+_INV_SQRT_2PI = 1.0 / np.sqrt(2 * np.pi)
+
+
+def _norm_pdf(x):
+    """Standard normal pdf, without scipy.stats' distribution-object overhead."""
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
 class BlackScholes:
     """
     Black-Scholes option pricing model with complete Greeks suite.
@@ -126,11 +134,11 @@ class BlackScholes:
         d1, d2 = self._d1(), self._d2()
         
         if self.option_type == 'call':
-            return (self.S * norm.cdf(d1) - 
-                   self.K * np.exp(-self.r * self.T) * norm.cdf(d2))
+            return (self.S * ndtr(d1) - 
+                   self.K * np.exp(-self.r * self.T) * ndtr(d2))
         else:  # put
-            return (self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - 
-                   self.S * norm.cdf(-d1))
+            return (self.K * np.exp(-self.r * self.T) * ndtr(-d2) - 
+                   self.S * ndtr(-d1))
     
     def delta(self) -> float:
         """
@@ -151,9 +159,9 @@ class BlackScholes:
         """
         d1 = self._d1()
         if self.option_type == 'call':
-            return norm.cdf(d1)
+            return ndtr(d1)
         else:
-            return norm.cdf(d1) - 1
+            return ndtr(d1) - 1
     
     def gamma(self) -> float:
         """
@@ -173,7 +181,7 @@ class BlackScholes:
         where φ(x) is the standard normal probability density function.
         """
         d1 = self._d1()
-        return (norm.pdf(d1) / 
+        return (_norm_pdf(d1) / 
                (self.S * self.sigma * np.sqrt(self.T)))
     
     def theta(self) -> float:
@@ -198,12 +206,12 @@ class BlackScholes:
         """
         d1, d2 = self._d1(), self._d2()
         
-        first_term = -(self.S * norm.pdf(d1) * self.sigma) / (2 * np.sqrt(self.T))
+        first_term = -(self.S * _norm_pdf(d1) * self.sigma) / (2 * np.sqrt(self.T))
         
         if self.option_type == 'call':
-            second_term = -self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+            second_term = -self.r * self.K * np.exp(-self.r * self.T) * ndtr(d2)
         else:
-            second_term = self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2)
+            second_term = self.r * self.K * np.exp(-self.r * self.T) * ndtr(-d2)
             
         return first_term + second_term
     
@@ -223,7 +231,7 @@ class BlackScholes:
         ν = S₀φ(d₁)√T / 100
         """
         d1 = self._d1()
-        return (self.S * norm.pdf(d1) * np.sqrt(self.T)) / 100
+        return (self.S * _norm_pdf(d1) * np.sqrt(self.T)) / 100
     
     def rho(self) -> float:
         """
@@ -246,10 +254,10 @@ class BlackScholes:
         
         if self.option_type == 'call':
             return (self.K * self.T * np.exp(-self.r * self.T) * 
-                   norm.cdf(d2)) / 100
+                   ndtr(d2)) / 100
         else:
             return -(self.K * self.T * np.exp(-self.r * self.T) * 
-                    norm.cdf(-d2)) / 100
+                    ndtr(-d2)) / 100
     
     def greeks(self) -> Dict[str, float]:
         """
@@ -363,4 +371,100 @@ Greeks:
   Vega (ν):           ${greeks['vega']:>8.2f} /1% vol
   Rho (ρ):            ${greeks['rho']:>8.2f} /1% rate
         """
-        return summary.strip()
\ No newline at end of file
+        return summary.strip()
+
+
+def greeks_batch(
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    r: float,
+    sigma: Union[float, np.ndarray],
+    option_types: Union[str, Sequence[str]] = 'call'
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate price and all Greeks for a batch of options in one pass.
+    
+    Inputs are broadcast against each other, so a single call can price every
+    leg of a strategy or a whole strike/expiry grid. d₁, d₂ and the normal
+    cdf/pdf are evaluated once per batch, instead of once per Greek per option
+    as with individual BlackScholes objects.
+    
+    Parameters
+    ----------
+    S : float or array_like
+        Current stock price
+    K : float or array_like
+        Strike price
+    T : float or array_like
+        Time to expiration in years
+    r : float
+        Risk-free interest rate (annualized)
+    sigma : float or array_like
+        Volatility of underlying asset (annualized)
+    option_types : {'call', 'put'} or sequence of them, default 'call'
+        Type of each option, broadcast against the other inputs
+        
+    Returns
+    -------
+    dict
+        Dictionary of arrays with the same keys and units as
+        BlackScholes.greeks(): price, delta, gamma, theta (per year),
+        vega (per 1%) and rho (per 1%)
+        
+    Examples
+    --------
+    >>> # Price both legs of a bull call spread at once
+    >>> legs = greeks_batch(S=100, K=[100, 110], T=0.25, r=0.05, sigma=0.2)
+    >>> spread_cost = legs['price'][0] - legs['price'][1]
+    """
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    option_types = np.char.lower(np.asarray(option_types, dtype=str))
+    
+    # Input validation
+    if np.any(S <= 0):
+        raise ValueError("Stock price (S) must be positive")
+    if np.any(K <= 0):
+        raise ValueError("Strike price (K) must be positive")
+    if np.any(T <= 0):
+        raise ValueError("Time to expiration (T) must be positive")
+    if np.any(sigma <= 0):
+        raise ValueError("Volatility (sigma) must be positive")
+    if not np.all(np.isin(option_types, ['call', 'put'])):
+        raise ValueError("option_type must be 'call' or 'put'")
+    
+    # Warn for extreme parameters
+    if np.any(T > 5):
+        warnings.warn("Time to expiration > 5 years may produce unrealistic results")
+    if np.any(sigma > 2):
+        warnings.warn("Volatility > 200% may produce unrealistic results")
+    
+    # Broadcast up front so every output has the full batch shape
+    S, K, T, sigma, is_call = np.broadcast_arrays(S, K, T, sigma, option_types == 'call')
+    sqrt_T = np.sqrt(T)
+    discount = np.exp(-r * T)
+    
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    Nd1 = ndtr(d1)
+    Nd2 = ndtr(d2)
+    nd1 = _norm_pdf(d1)
+    
+    # Put terms use N(-x) directly rather than 1 - N(x), which would lose
+    # all precision for deep out-of-the-money puts
+    N_minus_d1 = ndtr(-d1)
+    N_minus_d2 = ndtr(-d2)
+    
+    return {
+        'price': np.where(is_call, S * Nd1 - K * discount * Nd2,
+                          K * discount * N_minus_d2 - S * N_minus_d1),
+        'delta': np.where(is_call, Nd1, Nd1 - 1),
+        'gamma': nd1 / (S * sigma * sqrt_T),
+        'theta': (-(S * nd1 * sigma) / (2 * sqrt_T) +
+                  np.where(is_call, -r * K * discount * Nd2, r * K * discount * N_minus_d2)),
+        'vega': S * nd1 * sqrt_T / 100,
+        'rho': np.where(is_call, K * T * discount * Nd2, -K * T * discount * N_minus_d2) / 100
+    }
@@ -53,7 +53,28 @@ class RiskMetrics:
         if not (0 < confidence_level < 1):
             raise ValueError("Confidence level must be between 0 and 1")
         
-        return np.percentile(self.returns, confidence_level * 100)
+        var, _ = self._lower_tail(confidence_level)
+        return var
+    
+    def _lower_tail(self, confidence_level):
+        """
+        Locate the VaR quantile with a single O(N) partial sort.
+        
+        Only the order statistics around the quantile are put in place, so no
+        full sort of the returns is needed. The quantile is linearly
+        interpolated exactly like np.percentile.
+        
+        Returns:
+        tuple - (VaR value, partitioned returns array)
+        """
+        returns = self.returns.to_numpy()
+        position = confidence_level * (len(returns) - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, len(returns) - 1)
+        
+        partitioned = np.partition(returns, [lower, upper])
+        var = partitioned[lower] + (position - lower) * (partitioned[upper] - partitioned[lower])
+        return var, partitioned
     
     def var_parametric(self, confidence_level=0.05):
         """
@@ -103,9 +124,12 @@ class RiskMetrics:
         if len(self.returns) == 0:
             raise ValueError("No return data available for Expected Shortfall calculation")
         
-        var = self.var_historical(confidence_level)
+        if not (0 < confidence_level < 1):
+            raise ValueError("Confidence level must be between 0 and 1")
+        
+        var, partitioned = self._lower_tail(confidence_level)
         # Average of returns that are worse than VaR
-        tail_returns = self.returns[self.returns <= var]
+        tail_returns = partitioned[partitioned <= var]
         
         if len(tail_returns) == 0:
             # If no returns are worse than VaR, return the VaR itself
@@ -4,11 +4,12 @@ Test the Black-Scholes implementation.
 
 import sys
 import os
+import warnings
 
 # Add the src folder to Python path so we can import our code
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
-from quantflow.options.black_scholes import BlackScholes
+from quantflow.options.black_scholes import BlackScholes, greeks_batch
 
 
 def test_basic_call_option():
@@ -96,6 +97,42 @@ def test_greeks_summary():
     print("✓ Greeks summary test passed!")
 
 
+def test_greeks_batch_matches_single_options():
+    """Test that batched Greeks agree with individual BlackScholes objects."""
+    strikes = [90, 100, 110, 120]
+    option_types = ['call', 'put', 'call', 'put']
+    batch = greeks_batch(S=100, K=strikes, T=0.5, r=0.05, sigma=0.2, option_types=option_types)
+    
+    for i, (strike, option_type) in enumerate(zip(strikes, option_types)):
+        single = BlackScholes(S=100, K=strike, T=0.5, r=0.05, sigma=0.2, option_type=option_type).greeks()
+        for name, value in single.items():
+            assert abs(batch[name][i] - value) < 1e-10, f"{name} mismatch for {option_type} K={strike}"
+    print("✓ Batched Greeks test passed!")
+
+
+def test_greeks_batch_deep_otm_put():
+    """Test that deep out-of-the-money puts keep full relative precision."""
+    batch = greeks_batch(S=100, K=60, T=0.25, r=0.05, sigma=0.1, option_types='put')
+    single = BlackScholes(S=100, K=60, T=0.25, r=0.05, sigma=0.1, option_type='put').greeks()
+    
+    for name in ['price', 'theta', 'rho']:
+        assert single[name] != 0, f"Reference {name} underflowed"
+        assert abs(batch[name] / single[name] - 1) < 1e-10, f"{name} lost precision"
+    print("✓ Deep OTM put test passed!")
+
+
+def test_greeks_batch_warns_on_extreme_parameters():
+    """Test that batched pricing warns like BlackScholes for extreme inputs."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        greeks_batch(S=100, K=[100, 110], T=[1, 6], r=0.05, sigma=[0.2, 2.5])
+    
+    messages = [str(w.message) for w in caught]
+    assert any("Time to expiration > 5 years" in m for m in messages), messages
+    assert any("Volatility > 200%" in m for m in messages), messages
+    print("✓ Extreme parameter warning test passed!")
+
+
 if __name__ == "__main__":
     test_basic_call_option()
     test_delta_calculation()
@@ -103,4 +140,7 @@ if __name__ == "__main__":
     test_theta_calculation()
     test_vega_calculation()
     test_greeks_summary()
+    test_greeks_batch_matches_single_options()
+    test_greeks_batch_deep_otm_put()
+    test_greeks_batch_warns_on_extreme_parameters()
     print("All tests passed! 🎉")
\ No newline at end of file
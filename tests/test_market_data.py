@@ -4,10 +4,17 @@ Test the market data implementation.
 
 import sys
 import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
 
 # Add the src folder to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
+from quantflow.data import fetcher
 from quantflow.data.fetcher import MarketData
 
 
@@ -46,7 +53,75 @@ def test_returns_calculation():
     print("✓ Returns calculation test passed!")
 
 
+def test_cached_fetch():
+    """Test that a fresh cache entry is returned without hitting the network."""
+    pytest.importorskip("pyarrow")
+    
+    prices = pd.DataFrame({'AAPL': [100.0, 101.0, 102.5]},
+                          index=pd.date_range('2024-01-02', periods=3))
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        prices.to_parquet(Path(cache_dir) / 'AAPL_1y_1d.parquet')
+        data = MarketData.fetch_stock_data('AAPL', period='1y', cache_dir=cache_dir)
+    
+    pd.testing.assert_frame_equal(data, prices, check_freq=False)
+    print("✓ Cached fetch test passed!")
+
+
+class _FakeTicker:
+    """Offline stand-in for yfinance.Ticker returning fixed prices."""
+    
+    prices = pd.DataFrame({'Close': [200.0, 201.0, 203.0]},
+                          index=pd.date_range('2024-02-01', periods=3))
+    
+    def __init__(self, ticker):
+        self.ticker = ticker
+    
+    def history(self, period, interval):
+        return self.prices
+
+
+def test_stale_cache_refetches():
+    """Test that an expired cache entry is refetched and overwritten."""
+    pytest.importorskip("pyarrow")
+    
+    stale = pd.DataFrame({'AAPL': [100.0, 101.0]}, index=pd.date_range('2024-01-02', periods=2))
+    expected = _FakeTicker.prices.rename(columns={'Close': 'AAPL'})
+    
+    with tempfile.TemporaryDirectory() as cache_dir, pytest.MonkeyPatch.context() as mp:
+        mp.setattr(fetcher.yf, 'Ticker', _FakeTicker)
+        cache_path = Path(cache_dir) / 'AAPL_1y_1d.parquet'
+        stale.to_parquet(cache_path)
+        two_days_ago = time.time() - 2 * 86400
+        os.utime(cache_path, (two_days_ago, two_days_ago))
+        
+        data = MarketData.fetch_stock_data('AAPL', period='1y', cache_dir=cache_dir)
+        cached = pd.read_parquet(cache_path)
+    
+    pd.testing.assert_frame_equal(data, expected)
+    pd.testing.assert_frame_equal(cached, expected, check_freq=False)
+    print("✓ Stale cache test passed!")
+
+
+def test_cache_write_failure_still_returns_data():
+    """Test that a failing cache write only warns instead of failing the fetch."""
+    def failing_to_parquet(self, *args, **kwargs):
+        raise ValueError("simulated ArrowInvalid")
+    
+    with tempfile.TemporaryDirectory() as cache_dir, pytest.MonkeyPatch.context() as mp:
+        mp.setattr(fetcher.yf, 'Ticker', _FakeTicker)
+        mp.setattr(pd.DataFrame, 'to_parquet', failing_to_parquet)
+        data = MarketData.fetch_stock_data('AAPL', period='1y', cache_dir=cache_dir,
+                                           max_tries=1)
+    
+    pd.testing.assert_frame_equal(data, _FakeTicker.prices.rename(columns={'Close': 'AAPL'}))
+    print("✓ Cache write failure test passed!")
+
+
 if __name__ == "__main__":
     test_single_stock_fetch()
     test_returns_calculation()
+    test_cached_fetch()
+    test_stale_cache_refetches()
+    test_cache_write_failure_still_returns_data()
     print("\nAll market data tests passed! 🎉")
\ No newline at end of file
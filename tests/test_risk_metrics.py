@@ -59,6 +59,24 @@ def test_expected_shortfall():
     print("✓ Expected Shortfall test passed!")
 
 
+def test_var_es_match_full_sort():
+    """Test that the partition-based VaR/ES match the percentile definitions."""
+    np.random.seed(42)
+    returns = np.random.normal(0.001, 0.02, 1000)
+    
+    risk_metrics = RiskMetrics(returns)
+    for level in [0.01, 0.05, 0.10]:
+        var = risk_metrics.var_historical(level)
+        es = risk_metrics.expected_shortfall(level)
+        
+        expected_var = np.percentile(returns, level * 100)
+        expected_es = returns[returns <= expected_var].mean()
+        
+        assert np.isclose(var, expected_var), f"VaR {var} != {expected_var} at {level}"
+        assert np.isclose(es, expected_es), f"ES {es} != {expected_es} at {level}"
+    print("✓ VaR/ES partition test passed!")
+
+
 def test_max_drawdown():
     """Test Maximum Drawdown calculation."""
     np.random.seed(42)
@@ -78,5 +96,6 @@ if __name__ == "__main__":
     test_var_calculation()
     test_sharpe_ratio()
     test_expected_shortfall()
+    test_var_es_match_full_sort()
     test_max_drawdown()
     print("All risk metrics tests passed! 🎉")
\ No newline at end of file